@@ -0,0 +1,68 @@
+"""Microbenchmark of InMemoryTaskStore get/save throughput.
+
+Usage:
+    uv run python benchmarks/bench_inmemory_task_store.py [--ops N]
+"""
+
+import argparse
+import asyncio
+import time
+
+from a2a.server.tasks import InMemoryTaskStore
+from a2a.types import Task, TaskState, TaskStatus
+
+
+def _make_tasks(count: int, state: TaskState) -> list[Task]:
+    return [
+        Task(
+            id=f'task-{i}',
+            contextId='bench',
+            status=TaskStatus(state=state),
+        )
+        for i in range(count)
+    ]
+
+
+async def _bench(
+    store: InMemoryTaskStore, ops: int, state: TaskState
+) -> tuple[float, float]:
+    tasks = _make_tasks(1000, state)
+
+    start = time.perf_counter()
+    for i in range(ops):
+        await store.save(tasks[i % len(tasks)])
+    save_rate = ops / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for i in range(ops):
+        await store.get(tasks[i % len(tasks)].id)
+    get_rate = ops / (time.perf_counter() - start)
+
+    return save_rate, get_rate
+
+
+def main() -> None:
+    """Runs the benchmark and prints operations per second."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--ops', type=int, default=200_000)
+    args = parser.parse_args()
+
+    # The bounded store holds half of the working set, so about half of the
+    # saves evict a (terminal) task.
+    for label, store, state in (
+        ('unbounded', InMemoryTaskStore(), TaskState.working),
+        (
+            'max_entries=500',
+            InMemoryTaskStore(max_entries=500),
+            TaskState.completed,
+        ),
+    ):
+        save_rate, get_rate = asyncio.run(_bench(store, args.ops, state))
+        print(
+            f'{label:>16}: save {save_rate:>12,.0f} ops/s'
+            f' | get {get_rate:>12,.0f} ops/s'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -20,6 +20,8 @@ from a2a.types import (
     GetTaskPushNotificationConfigResponse,
     GetTaskRequest,
     GetTaskResponse,
+    ListTasksRequest,
+    ListTasksResponse,
     SendMessageRequest,
     SendMessageResponse,
     SendStreamingMessageRequest,
@@ -384,6 +386,41 @@ class A2AClient:
         response_data = await self._send_request(payload, modified_kwargs)
         return GetTaskResponse.model_validate(response_data)
 
+    async def list_tasks(
+        self,
+        request: ListTasksRequest,
+        *,
+        http_kwargs: dict[str, Any] | None = None,
+        context: ClientCallContext | None = None,
+    ) -> ListTasksResponse:
+        """Lists tasks matching the given filters, one page at a time.
+
+        Args:
+            request: The `ListTasksRequest` object specifying filters and the pagination cursor.
+            http_kwargs: Optional dictionary of keyword arguments to pass to the
+                underlying httpx.post request.
+            context: The client call context.
+
+        Returns:
+            A `ListTasksResponse` object containing a page of tasks or an error.
+
+        Raises:
+            A2AClientHTTPError: If an HTTP error occurs during the request.
+            A2AClientJSONError: If the response body cannot be decoded as JSON or validated.
+        """
+        if not request.id:
+            request.id = str(uuid4())
+
+        # Apply interceptors before sending
+        payload, modified_kwargs = await self._apply_interceptors(
+            'tasks/list',
+            request.model_dump(mode='json', exclude_none=True),
+            http_kwargs,
+            context,
+        )
+        response_data = await self._send_request(payload, modified_kwargs)
+        return ListTasksResponse.model_validate(response_data)
+
     async def cancel_task(
         self,
         request: CancelTaskRequest,
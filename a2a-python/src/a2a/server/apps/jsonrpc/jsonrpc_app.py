@@ -35,6 +35,7 @@ from a2a.types import (
     JSONRPCErrorResponse,
     JSONRPCResponse,
     ListTaskPushNotificationConfigRequest,
+    ListTasksRequest,
     SendMessageRequest,
     SendStreamingMessageRequest,
     SendStreamingMessageResponse,
@@ -278,7 +279,7 @@ class JSONRPCApplication(ABC):
         a2a_request: A2ARequest,
         context: ServerCallContext,
     ) -> Response:
-        """Processes non-streaming requests (message/send, tasks/get, tasks/cancel, tasks/pushNotificationConfig/*).
+        """Processes non-streaming requests (message/send, tasks/get, tasks/list, tasks/cancel, tasks/pushNotificationConfig/*).
 
         Args:
             request_id: The ID of the request.
@@ -303,6 +304,10 @@ class JSONRPCApplication(ABC):
                 handler_result = await self.handler.on_get_task(
                     request_obj, context
                 )
+            case ListTasksRequest():
+                handler_result = await self.handler.on_list_tasks(
+                    request_obj, context
+                )
             case SetTaskPushNotificationConfigRequest():
                 handler_result = (
                     await self.handler.set_push_notification_config(
@@ -1,3 +1,4 @@
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 
@@ -10,13 +11,13 @@ else:
         return func
 
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from a2a.types import Artifact, Message, TaskStatus
 
 
 try:
-    from sqlalchemy import JSON, Dialect, String
+    from sqlalchemy import JSON, DateTime, Dialect, Index, String
     from sqlalchemy.orm import (
         DeclarativeBase,
         Mapped,
@@ -89,6 +90,9 @@ class PydanticListType(TypeDecorator, Generic[T]):
             **kwargs: Additional arguments for TypeDecorator.
         """
         self.pydantic_type = pydantic_type
+        # Validating the whole list in one call stays inside pydantic-core
+        # instead of calling model_validate once per element.
+        self._list_adapter = TypeAdapter(list[pydantic_type])  # type: ignore[valid-type]
         super().__init__(**kwargs)
 
     def process_bind_param(
@@ -110,7 +114,7 @@ class PydanticListType(TypeDecorator, Generic[T]):
         """Convert a JSON-like list from the DB back to a list of Pydantic models."""
         if value is None:
             return None
-        return [self.pydantic_type.model_validate(item) for item in value]
+        return self._list_adapter.validate_python(value)
 
 
 # Base class for all database models
@@ -137,6 +141,28 @@ class TaskMixin:
         PydanticListType(Message), nullable=True
     )
 
+    # Denormalized copies of the status state and save times, so tasks can be
+    # filtered by indexed columns instead of deserializing the status blob.
+    state: Mapped[str | None] = mapped_column(String(32), nullable=True)
+    created_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        default=lambda: datetime.now(timezone.utc),
+    )
+    updated_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True, index=True
+    )
+
+    @declared_attr.directive
+    @classmethod
+    def __table_args__(cls) -> tuple[Index, ...]:
+        """Define composite indexes used when listing tasks."""
+        table_name = cls.__tablename__  # type: ignore[attr-defined]
+        return (
+            Index(f'ix_{table_name}_contextId_state', 'contextId', 'state'),
+            Index(f'ix_{table_name}_state_updated_at', 'state', 'updated_at'),
+        )
+
     # Using declared_attr to avoid conflict with Pydantic's metadata
     @declared_attr
     @classmethod
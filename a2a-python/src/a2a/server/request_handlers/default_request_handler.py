@@ -32,6 +32,8 @@ from a2a.types import (
     InternalError,
     InvalidParamsError,
     ListTaskPushNotificationConfigParams,
+    ListTasksParams,
+    ListTasksResult,
     Message,
     MessageSendConfiguration,
     MessageSendParams,
@@ -115,6 +117,24 @@ class DefaultRequestHandler(RequestHandler):
             raise ServerError(error=TaskNotFoundError())
         return task
 
+    async def on_list_tasks(
+        self,
+        params: ListTasksParams,
+        context: ServerCallContext | None = None,
+    ) -> ListTasksResult:
+        """Default handler for 'tasks/list'.
+
+        Delegates to the `TaskStore`, which filters on indexed fields.
+        """
+        try:
+            return await self.task_store.list_tasks(params)
+        except NotImplementedError as e:
+            raise ServerError(
+                error=UnsupportedOperationError(message=str(e))
+            ) from e
+        except ValueError as e:
+            raise ServerError(error=InvalidParamsError(message=str(e))) from e
+
     async def on_cancel_task(
         self, params: TaskIdParams, context: ServerCallContext | None = None
     ) -> Task | None:
@@ -380,7 +400,7 @@ class DefaultRequestHandler(RequestHandler):
         if not self._push_config_store:
             raise ServerError(error=UnsupportedOperationError())
 
-        task: Task | None = await self.task_store.get(params.taskId)
+        task: Task | None = await self.task_store.get_summary(params.taskId)
         if not task:
             raise ServerError(error=TaskNotFoundError())
 
@@ -403,7 +423,7 @@ class DefaultRequestHandler(RequestHandler):
         if not self._push_config_store:
             raise ServerError(error=UnsupportedOperationError())
 
-        task: Task | None = await self.task_store.get(params.id)
+        task: Task | None = await self.task_store.get_summary(params.id)
         if not task:
             raise ServerError(error=TaskNotFoundError())
 
@@ -431,7 +451,7 @@ class DefaultRequestHandler(RequestHandler):
         Allows a client to re-attach to a running streaming task's event stream.
         Requires the task and its queue to still be active.
         """
-        task: Task | None = await self.task_store.get(params.id)
+        task: Task | None = await self.task_store.get_summary(params.id)
         if not task:
             raise ServerError(error=TaskNotFoundError())
 
@@ -471,7 +491,7 @@ class DefaultRequestHandler(RequestHandler):
         if not self._push_config_store:
             raise ServerError(error=UnsupportedOperationError())
 
-        task: Task | None = await self.task_store.get(params.id)
+        task: Task | None = await self.task_store.get_summary(params.id)
         if not task:
             raise ServerError(error=TaskNotFoundError())
 
@@ -502,7 +522,7 @@ class DefaultRequestHandler(RequestHandler):
         if not self._push_config_store:
             raise ServerError(error=UnsupportedOperationError())
 
-        task: Task | None = await self.task_store.get(params.id)
+        task: Task | None = await self.task_store.get_summary(params.id)
         if not task:
             raise ServerError(error=TaskNotFoundError())
 
@@ -24,6 +24,10 @@ from a2a.types import (
     ListTaskPushNotificationConfigRequest,
     ListTaskPushNotificationConfigResponse,
     ListTaskPushNotificationConfigSuccessResponse,
+    ListTasksRequest,
+    ListTasksResponse,
+    ListTasksResult,
+    ListTasksSuccessResponse,
     Message,
     SendMessageRequest,
     SendMessageResponse,
@@ -332,6 +336,38 @@ class JSONRPCHandler:
                 )
             )
 
+    async def on_list_tasks(
+        self,
+        request: ListTasksRequest,
+        context: ServerCallContext | None = None,
+    ) -> ListTasksResponse:
+        """Handles the 'tasks/list' JSON-RPC method.
+
+        Args:
+            request: The incoming `ListTasksRequest` object.
+            context: Context provided by the server.
+
+        Returns:
+            A `ListTasksResponse` object containing a page of tasks or a JSON-RPC error.
+        """
+        try:
+            result = await self.request_handler.on_list_tasks(
+                request.params, context
+            )
+            return prepare_response_object(
+                request.id,
+                result,
+                (ListTasksResult,),
+                ListTasksSuccessResponse,
+                ListTasksResponse,
+            )
+        except ServerError as e:
+            return ListTasksResponse(
+                root=JSONRPCErrorResponse(
+                    id=request.id, error=e.error if e.error else InternalError()
+                )
+            )
+
     async def list_push_notification_config(
         self,
         request: ListTaskPushNotificationConfigRequest,
@@ -7,6 +7,8 @@ from a2a.types import (
     DeleteTaskPushNotificationConfigParams,
     GetTaskPushNotificationConfigParams,
     ListTaskPushNotificationConfigParams,
+    ListTasksParams,
+    ListTasksResult,
     Message,
     MessageSendParams,
     Task,
@@ -43,6 +45,27 @@ class RequestHandler(ABC):
             The `Task` object if found, otherwise `None`.
         """
 
+    async def on_list_tasks(
+        self,
+        params: ListTasksParams,
+        context: ServerCallContext | None = None,
+    ) -> ListTasksResult:
+        """Handles the 'tasks/list' method.
+
+        Lists tasks matching the given filters, one page at a time.
+
+        Args:
+            params: Parameters including the filters and pagination cursor.
+            context: Context provided by the server.
+
+        Returns:
+            A `ListTasksResult` with a page of tasks and the next cursor.
+
+        Raises:
+             ServerError(UnsupportedOperationError): By default, if not implemented.
+        """
+        raise ServerError(error=UnsupportedOperationError())
+
     @abstractmethod
     async def on_cancel_task(
         self,
@@ -18,6 +18,9 @@ from a2a.types import (
     JSONRPCErrorResponse,
     ListTaskPushNotificationConfigResponse,
     ListTaskPushNotificationConfigSuccessResponse,
+    ListTasksResponse,
+    ListTasksResult,
+    ListTasksSuccessResponse,
     Message,
     SendMessageResponse,
     SendMessageSuccessResponse,
@@ -41,7 +44,8 @@ RT = TypeVar(
     GetTaskPushNotificationConfigResponse,
     SendStreamingMessageResponse,
     ListTaskPushNotificationConfigResponse,
-    DeleteTaskPushNotificationConfigResponse
+    DeleteTaskPushNotificationConfigResponse,
+    ListTasksResponse,
 )
 """Type variable for RootModel response types."""
 
@@ -55,7 +59,8 @@ SPT = TypeVar(
     GetTaskPushNotificationConfigSuccessResponse,
     SendStreamingMessageSuccessResponse,
     ListTaskPushNotificationConfigSuccessResponse,
-    DeleteTaskPushNotificationConfigSuccessResponse
+    DeleteTaskPushNotificationConfigSuccessResponse,
+    ListTasksSuccessResponse,
 )
 """Type variable for SuccessResponse types."""
 
@@ -69,6 +74,7 @@ EventTypes = (
     | A2AError
     | JSONRPCError
     | list[TaskPushNotificationConfig]
+    | ListTasksResult
 )
 """Type alias for possible event types produced by handlers."""
 
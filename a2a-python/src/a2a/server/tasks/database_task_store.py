@@ -1,9 +1,10 @@
 import logging
 from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 from typing import AsyncGenerator
 
 try:
-    from sqlalchemy import delete, select
+    from sqlalchemy import Connection, delete, inspect, select, text, update
     from sqlalchemy.exc import OperationalError, DBAPIError
     from sqlalchemy.ext.asyncio import (
         AsyncEngine,
@@ -21,8 +22,12 @@ except ImportError as e:
     ) from e
 
 from a2a.server.models import Base, TaskModel, create_task_model
-from a2a.server.tasks.task_store import TaskStore
-from a2a.types import Task  # Task is the Pydantic model
+from a2a.server.tasks.task_store import TaskStore, parse_timestamp
+from a2a.types import (  # Task is the Pydantic model
+    ListTasksParams,
+    ListTasksResult,
+    Task,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -98,9 +103,52 @@ class DatabaseTaskStore(TaskStore):
             async with self.engine.begin() as conn:
                 # This will create the 'tasks' table based on TaskModel's definition
                 await conn.run_sync(Base.metadata.create_all)
+                await conn.run_sync(self._upgrade_schema)
         self._initialized = True
         logger.debug('Database schema initialized.')
 
+    def _upgrade_schema(self, conn: Connection) -> None:
+        """Adds columns and indexes missing from a table created by an older version.
+
+        `create_all` never alters existing tables, so columns introduced after
+        a table was created are added here. The denormalized `state` column is
+        backfilled from the stored status.
+        """
+        table = self.task_model.__table__
+        existing = {
+            column['name'] for column in inspect(conn).get_columns(table.name)
+        }
+        missing = [
+            column for column in table.columns if column.name not in existing
+        ]
+        if not missing:
+            return
+
+        preparer = conn.dialect.identifier_preparer
+        for column in missing:
+            logger.info(
+                f'Adding missing column {column.name} to table {table.name}'
+            )
+            conn.execute(
+                text(
+                    f'ALTER TABLE {preparer.format_table(table)} '
+                    f'ADD COLUMN {preparer.format_column(column)} '
+                    f'{column.type.compile(dialect=conn.dialect)}'
+                )
+            )
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+
+        if any(column.name == 'state' for column in missing):
+            rows = conn.execute(select(table.c.id, table.c.status)).all()
+            for task_id, status in rows:
+                if status is not None:
+                    conn.execute(
+                        update(table)
+                        .where(table.c.id == task_id)
+                        .values(state=status.state.value)
+                    )
+
     async def _ensure_initialized(self) -> None:
         """Ensure the database connection is initialized."""
         if not self._initialized:
@@ -116,10 +164,17 @@ class DatabaseTaskStore(TaskStore):
             artifacts=task.artifacts,
             history=task.history,
             task_metadata=task.metadata,
+            state=task.status.state.value,
+            updated_at=datetime.now(timezone.utc),
         )
 
     def _from_orm(self, task_model: TaskModel) -> Task:
-        """Maps a SQLAlchemy TaskModel to a Pydantic Task instance."""
+        """Maps a SQLAlchemy TaskModel to a Pydantic Task instance.
+
+        The Pydantic column types already validated `status`, `artifacts` and
+        `history`; `Task.model_validate` accepts those instances as-is rather
+        than validating them again.
+        """
         # Map database columns to Pydantic model fields
         task_data_from_db = {
             'id': task_model.id,
@@ -158,6 +213,65 @@ class DatabaseTaskStore(TaskStore):
             logger.debug(f'Task {task_id} not found in store.')
             return None
 
+    async def get_summary(self, task_id: str) -> Task | None:
+        """Retrieves a task without loading its history and artifacts columns."""
+        await self._ensure_initialized()
+
+        stmt = select(
+            self.task_model.id,
+            self.task_model.contextId,
+            self.task_model.kind,
+            self.task_model.status,
+            self.task_model.task_metadata,
+        ).where(self.task_model.id == task_id)
+        async with self._get_session() as session:
+            result = await session.execute(stmt)
+            row = result.one_or_none()
+
+        if row is None:
+            logger.debug(f'Task {task_id} not found in store.')
+            return None
+        return Task.model_validate(
+            {
+                'id': row.id,
+                'contextId': row.contextId,
+                'kind': row.kind,
+                'status': row.status,
+                'metadata': row.task_metadata,
+            }
+        )
+
+    async def list_tasks(self, params: ListTasksParams) -> ListTasksResult:
+        """Lists tasks from the database using the indexed filter columns."""
+        await self._ensure_initialized()
+
+        stmt = select(self.task_model)
+        if params.contextId is not None:
+            stmt = stmt.where(self.task_model.contextId == params.contextId)
+        if params.state is not None:
+            stmt = stmt.where(self.task_model.state == params.state.value)
+        if params.updatedSince is not None:
+            stmt = stmt.where(
+                self.task_model.updated_at
+                >= parse_timestamp(params.updatedSince)
+            )
+        if params.cursor is not None:
+            stmt = stmt.where(self.task_model.id > params.cursor)
+        # Fetch one extra row to know whether another page follows.
+        stmt = stmt.order_by(self.task_model.id).limit(params.pageSize + 1)
+
+        async with self._get_session() as session:
+            result = await session.execute(stmt)
+            task_models = result.scalars().all()
+
+        tasks = [
+            self._from_orm(model) for model in task_models[: params.pageSize]
+        ]
+        next_cursor = (
+            tasks[-1].id if len(task_models) > params.pageSize else None
+        )
+        return ListTasksResult(tasks=tasks, nextCursor=next_cursor)
+
     async def delete(self, task_id: str) -> None:
         """Deletes a task from the database by ID with proper error handling."""
         await self._ensure_initialized()
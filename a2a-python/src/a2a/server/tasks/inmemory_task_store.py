@@ -1,85 +1,231 @@
-import asyncio
 import logging
+import threading
+import time
 
-from a2a.server.tasks.task_store import TaskStore
-from a2a.types import Task
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
 
+from a2a.server.tasks.task_store import TaskStore, parse_timestamp
+from a2a.types import ListTasksParams, ListTasksResult, Task, TaskState
 
-logger = logging.getLogger(__name__)
 
+logger = logging.getLogger(__name__)
 
-class ReadWriteLock:
-    """Simple read-write lock implementation for asyncio."""
-    
-    def __init__(self):
-        self._read_ready = asyncio.Condition(asyncio.Lock())
-        self._readers = 0
-    
-    async def acquire_read(self):
-        async with self._read_ready:
-            self._readers += 1
-    
-    async def release_read(self):
-        async with self._read_ready:
-            self._readers -= 1
-            if self._readers == 0:
-                self._read_ready.notify_all()
-    
-    async def acquire_write(self):
-        await self._read_ready.acquire()
-        await self._read_ready.wait_for(lambda: self._readers == 0)
-    
-    async def release_write(self):
-        self._read_ready.release()
+TERMINAL_TASK_STATES = {
+    TaskState.completed,
+    TaskState.canceled,
+    TaskState.failed,
+    TaskState.rejected,
+}
 
 
 class InMemoryTaskStore(TaskStore):
-    """In-memory implementation of TaskStore with optimized read-write locking.
+    """In-memory implementation of TaskStore.
 
     Stores task objects in a dictionary in memory. Task data is lost when the
-    server process stops. Uses read-write locks to allow concurrent reads.
+    server process stops. All dictionary work is synchronous, so reads and
+    writes never await; a `threading.Lock` is held only around the dictionary
+    updates, which keeps the store safe when shared across threads.
+
+    The store can optionally be bounded by entry count, by estimated size in
+    bytes, and by a time-to-live for tasks in a terminal state. When a limit
+    is exceeded, least recently used terminal tasks are evicted first; active
+    tasks are only evicted if no terminal task is left. Evicted tasks can be
+    handed to a `spill_callback`, e.g. the `save` method of a secondary store.
     """
 
-    def __init__(self) -> None:
-        """Initializes the InMemoryTaskStore."""
-        logger.debug('Initializing InMemoryTaskStore with read-write locks')
-        self.tasks: dict[str, Task] = {}
-        self.lock = ReadWriteLock()
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        ttl: float | None = None,
+        spill_callback: Callable[[Task], Awaitable[None]] | None = None,
+    ) -> None:
+        """Initializes the InMemoryTaskStore.
+
+        Args:
+            max_entries: Maximum number of tasks kept in memory. Unbounded if None.
+            max_bytes: Maximum estimated size of all stored tasks, in bytes
+              of their JSON serialization. Unbounded if None.
+            ttl: Seconds a task in a terminal state may go without being read
+              or written before it is evicted. Never expires if None.
+            spill_callback: Optional coroutine function called with each
+              evicted task, e.g. to persist it into a secondary store.
+        """
+        logger.debug('Initializing InMemoryTaskStore')
+        self.tasks: OrderedDict[str, Task] = OrderedDict()
+        self.lock = threading.Lock()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.spill_callback = spill_callback
+        self._sizes: dict[str, int] = {}
+        self._total_bytes = 0
+        self._updated_at: dict[str, datetime] = {}
+        # Terminal task IDs in least recently used order, with last access time.
+        self._terminal: OrderedDict[str, float] = OrderedDict()
 
     async def save(self, task: Task) -> None:
         """Saves or updates a task in the in-memory store."""
-        await self.lock.acquire_write()
-        try:
+        size = self._estimate_size(task) if self.max_bytes is not None else None
+        with self.lock:
+            self._remove(task.id)
             self.tasks[task.id] = task
-            logger.debug('Task %s saved successfully.', task.id)
-        finally:
-            await self.lock.release_write()
+            self._updated_at[task.id] = datetime.now(timezone.utc)
+            if size is not None:
+                self._sizes[task.id] = size
+                self._total_bytes += size
+            if task.status.state in TERMINAL_TASK_STATES:
+                self._terminal[task.id] = time.monotonic()
+            evicted = self._collect_evictions(protected_id=task.id)
+        logger.debug('Task %s saved successfully.', task.id)
+        await self._spill(evicted)
 
     async def get(self, task_id: str) -> Task | None:
         """Retrieves a task from the in-memory store by ID."""
-        await self.lock.acquire_read()
-        try:
-            logger.debug('Attempting to get task with id: %s', task_id)
+        logger.debug('Attempting to get task with id: %s', task_id)
+        with self.lock:
             task = self.tasks.get(task_id)
             if task:
-                logger.debug('Task %s retrieved successfully.', task_id)
-            else:
-                logger.debug('Task %s not found in store.', task_id)
-            return task
-        finally:
-            await self.lock.release_read()
+                self._touch(task_id)
+        if task:
+            logger.debug('Task %s retrieved successfully.', task_id)
+        else:
+            logger.debug('Task %s not found in store.', task_id)
+        if self.ttl is not None:
+            await self.evict_expired()
+        return task
 
     async def delete(self, task_id: str) -> None:
         """Deletes a task from the in-memory store by ID."""
-        await self.lock.acquire_write()
-        try:
-            logger.debug('Attempting to delete task with id: %s', task_id)
-            if task_id in self.tasks:
-                del self.tasks[task_id]
-                logger.debug('Task %s deleted successfully.', task_id)
-            else:
+        logger.debug('Attempting to delete task with id: %s', task_id)
+        with self.lock:
+            removed = self._remove(task_id)
+        if removed:
+            logger.debug('Task %s deleted successfully.', task_id)
+        else:
+            logger.warning(
+                'Attempted to delete nonexistent task with id: %s', task_id
+            )
+
+    async def list_tasks(self, params: ListTasksParams) -> ListTasksResult:
+        """Lists tasks in the in-memory store matching the given filters."""
+        updated_since = (
+            parse_timestamp(params.updatedSince)
+            if params.updatedSince
+            else None
+        )
+        with self.lock:
+            matches = sorted(
+                (
+                    task
+                    for task_id, task in self.tasks.items()
+                    if (params.cursor is None or task_id > params.cursor)
+                    and (
+                        params.contextId is None
+                        or task.contextId == params.contextId
+                    )
+                    and (
+                        params.state is None
+                        or task.status.state == params.state
+                    )
+                    and (
+                        updated_since is None
+                        or self._updated_at[task_id] >= updated_since
+                    )
+                ),
+                key=lambda task: task.id,
+            )
+        page = matches[: params.pageSize]
+        next_cursor = page[-1].id if len(matches) > params.pageSize else None
+        return ListTasksResult(tasks=page, nextCursor=next_cursor)
+
+    async def evict_expired(self) -> None:
+        """Evicts terminal tasks whose time-to-live has elapsed."""
+        if self.ttl is None or not self._terminal:
+            return
+        with self.lock:
+            evicted = self._collect_evictions()
+        await self._spill(evicted)
+
+    def memory_usage(self) -> int:
+        """Returns the estimated size of all stored tasks, in bytes.
+
+        The estimate is the length of each task's JSON serialization. It is
+        tracked incrementally when `max_bytes` is set and computed on demand
+        otherwise.
+        """
+        if self.max_bytes is not None:
+            return self._total_bytes
+        return sum(self._estimate_size(task) for task in self.tasks.values())
+
+    @staticmethod
+    def _estimate_size(task: Task) -> int:
+        return len(task.model_dump_json(exclude_none=True))
+
+    def _touch(self, task_id: str) -> None:
+        """Marks a task as most recently used."""
+        self.tasks.move_to_end(task_id)
+        if task_id in self._terminal:
+            self._terminal[task_id] = time.monotonic()
+            self._terminal.move_to_end(task_id)
+
+    def _remove(self, task_id: str) -> Task | None:
+        """Removes a task and its bookkeeping, returning the removed task."""
+        task = self.tasks.pop(task_id, None)
+        self._total_bytes -= self._sizes.pop(task_id, 0)
+        self._updated_at.pop(task_id, None)
+        self._terminal.pop(task_id, None)
+        return task
+
+    def _over_limit(self) -> bool:
+        return (
+            self.max_entries is not None and len(self.tasks) > self.max_entries
+        ) or (self.max_bytes is not None and self._total_bytes > self.max_bytes)
+
+    def _collect_evictions(self, protected_id: str | None = None) -> list[Task]:
+        """Removes expired tasks and tasks above the configured limits.
+
+        Args:
+            protected_id: ID of a task that must not be evicted, typically the
+              one that was just saved.
+
+        Returns:
+            The evicted tasks, in eviction order.
+        """
+        evicted: list[Task] = []
+        if self.ttl is not None:
+            cutoff = time.monotonic() - self.ttl
+            while self._terminal:
+                task_id, last_access = next(iter(self._terminal.items()))
+                if last_access > cutoff:
+                    break
+                evicted.append(self._remove(task_id))  # type: ignore[arg-type]
+
+        while self._over_limit():
+            victim = next(
+                (tid for tid in self._terminal if tid != protected_id), None
+            ) or next((tid for tid in self.tasks if tid != protected_id), None)
+            if victim is None:
+                break
+            if victim not in self._terminal:
                 logger.warning(
-                    'Attempted to delete nonexistent task with id: %s', task_id
+                    'InMemoryTaskStore limits exceeded, evicting active task %s',
+                    victim,
                 )
-        finally:
-            await self.lock.release_write()
+            evicted.append(self._remove(victim))  # type: ignore[arg-type]
+
+        for task in evicted:
+            logger.debug('Task %s evicted from memory.', task.id)
+        return evicted
+
+    async def _spill(self, evicted: list[Task]) -> None:
+        """Hands evicted tasks to the spill callback, if configured."""
+        if not self.spill_callback:
+            return
+        for task in evicted:
+            try:
+                await self.spill_callback(task)
+            except Exception as e:
+                logger.error(f'Failed to spill evicted task {task.id}: {e}')
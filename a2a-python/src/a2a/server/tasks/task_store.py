@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
+from datetime import datetime, timezone
 
-from a2a.types import Task
+from a2a.types import ListTasksParams, ListTasksResult, Task
 
 
 class TaskStore(ABC):
@@ -20,3 +21,39 @@ class TaskStore(ABC):
     @abstractmethod
     async def delete(self, task_id: str) -> None:
         """Deletes a task from the store by ID."""
+
+    async def get_summary(self, task_id: str) -> Task | None:
+        """Retrieves a task without its history and artifacts.
+
+        Meant for callers that only need the task's ID, context and status.
+        Stores that can skip loading the heavy fields override this; the
+        default returns the full task.
+        """
+        return await self.get(task_id)
+
+    async def list_tasks(self, params: ListTasksParams) -> ListTasksResult:
+        """Lists tasks matching the given filters, ordered by task ID.
+
+        Results are paginated: `nextCursor` of the returned page is passed as
+        `params.cursor` to fetch the following page.
+
+        Raises:
+            NotImplementedError: If the store does not support listing tasks.
+        """
+        raise NotImplementedError(
+            f'{type(self).__name__} does not support listing tasks'
+        )
+
+
+def parse_timestamp(value: str) -> datetime:
+    """Parses an ISO 8601 timestamp into a timezone-aware UTC datetime.
+
+    Timestamps without an offset are assumed to be in UTC.
+
+    Raises:
+        ValueError: If the value is not a valid ISO 8601 timestamp.
+    """
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
@@ -882,6 +882,34 @@ class TaskState(str, Enum):
     unknown = 'unknown'
 
 
+class ListTasksParams(BaseModel):
+    """
+    Parameters for listing tasks, with optional filters and cursor pagination.
+    """
+
+    contextId: str | None = None
+    """
+    Only return tasks that belong to this context.
+    """
+    cursor: str | None = None
+    """
+    Opaque cursor returned as `nextCursor` by a previous 'tasks/list' call.
+    """
+    metadata: dict[str, Any] | None = None
+    pageSize: int = Field(50, ge=1, le=1000)
+    """
+    Maximum number of tasks to return.
+    """
+    state: TaskState | None = None
+    """
+    Only return tasks in this state.
+    """
+    updatedSince: str | None = None
+    """
+    Only return tasks last updated at or after this ISO 8601 datetime.
+    """
+
+
 class TextPart(BaseModel):
     """
     Represents a text segment within parts.
@@ -1088,6 +1116,30 @@ class GetTaskRequest(BaseModel):
     """
 
 
+class ListTasksRequest(BaseModel):
+    """
+    JSON-RPC request model for the 'tasks/list' method.
+    """
+
+    id: str | int
+    """
+    An identifier established by the Client that MUST contain a String, Number.
+    Numbers SHOULD NOT contain fractional parts.
+    """
+    jsonrpc: Literal['2.0'] = '2.0'
+    """
+    Specifies the version of the JSON-RPC protocol. MUST be exactly "2.0".
+    """
+    method: Literal['tasks/list'] = 'tasks/list'
+    """
+    A String containing the name of the method to be invoked.
+    """
+    params: ListTasksParams
+    """
+    A Structured value that holds the parameter values to be used during the invocation of the method.
+    """
+
+
 class JSONRPCErrorResponse(BaseModel):
     """
     Represents a JSON-RPC 2.0 Error Response object.
@@ -1543,6 +1595,7 @@ class A2ARequest(
         | TaskResubscriptionRequest
         | ListTaskPushNotificationConfigRequest
         | DeleteTaskPushNotificationConfigRequest
+        | ListTasksRequest
     ]
 ):
     root: (
@@ -1555,6 +1608,7 @@ class A2ARequest(
         | TaskResubscriptionRequest
         | ListTaskPushNotificationConfigRequest
         | DeleteTaskPushNotificationConfigRequest
+        | ListTasksRequest
     )
     """
     A2A supported request types
@@ -1715,6 +1769,41 @@ class GetTaskSuccessResponse(BaseModel):
     """
 
 
+class ListTasksResult(BaseModel):
+    """
+    A page of tasks returned by the 'tasks/list' method.
+    """
+
+    nextCursor: str | None = None
+    """
+    Cursor to pass to the next 'tasks/list' call, or null on the last page.
+    """
+    tasks: list[Task]
+    """
+    The tasks in this page.
+    """
+
+
+class ListTasksSuccessResponse(BaseModel):
+    """
+    JSON-RPC success response model for the 'tasks/list' method.
+    """
+
+    id: str | int | None = None
+    """
+    An identifier established by the Client that MUST contain a String, Number.
+    Numbers SHOULD NOT contain fractional parts.
+    """
+    jsonrpc: Literal['2.0'] = '2.0'
+    """
+    Specifies the version of the JSON-RPC protocol. MUST be exactly "2.0".
+    """
+    result: ListTasksResult
+    """
+    The result object on success.
+    """
+
+
 class SendMessageSuccessResponse(BaseModel):
     """
     JSON-RPC success response model for the 'message/send' method.
@@ -1780,6 +1869,7 @@ class JSONRPCResponse(
         | GetTaskPushNotificationConfigSuccessResponse
         | ListTaskPushNotificationConfigSuccessResponse
         | DeleteTaskPushNotificationConfigSuccessResponse
+        | ListTasksSuccessResponse
     ]
 ):
     root: (
@@ -1792,12 +1882,20 @@ class JSONRPCResponse(
         | GetTaskPushNotificationConfigSuccessResponse
         | ListTaskPushNotificationConfigSuccessResponse
         | DeleteTaskPushNotificationConfigSuccessResponse
+        | ListTasksSuccessResponse
     )
     """
     Represents a JSON-RPC 2.0 Response object.
     """
 
 
+class ListTasksResponse(RootModel[JSONRPCErrorResponse | ListTasksSuccessResponse]):
+    root: JSONRPCErrorResponse | ListTasksSuccessResponse
+    """
+    JSON-RPC response for the 'tasks/list' method.
+    """
+
+
 class SendMessageResponse(RootModel[JSONRPCErrorResponse | SendMessageSuccessResponse]):
     root: JSONRPCErrorResponse | SendMessageSuccessResponse
     """
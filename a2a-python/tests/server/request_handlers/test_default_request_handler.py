@@ -31,6 +31,7 @@ from a2a.server.tasks import (
 from a2a.types import (
     InternalError,
     InvalidParamsError,
+    ListTasksParams,
     Message,
     MessageSendConfiguration,
     MessageSendParams,
@@ -138,6 +139,64 @@ async def test_on_get_task_not_found():
     mock_task_store.get.assert_awaited_once_with('non_existent_task')
 
 
+@pytest.mark.asyncio
+async def test_on_list_tasks_delegates_to_task_store():
+    """Test on_list_tasks returns the page produced by the task store."""
+    task_store = InMemoryTaskStore()
+    await task_store.save(create_sample_task('task1', TaskState.working))
+    await task_store.save(create_sample_task('task2', TaskState.completed))
+
+    request_handler = DefaultRequestHandler(
+        agent_executor=DummyAgentExecutor(), task_store=task_store
+    )
+
+    result = await request_handler.on_list_tasks(
+        ListTasksParams(state=TaskState.working),
+        create_server_call_context(),
+    )
+
+    assert [task.id for task in result.tasks] == ['task1']
+    assert result.nextCursor is None
+
+
+@pytest.mark.asyncio
+async def test_on_list_tasks_invalid_updated_since():
+    """Test on_list_tasks rejects a malformed updatedSince timestamp."""
+    request_handler = DefaultRequestHandler(
+        agent_executor=DummyAgentExecutor(), task_store=InMemoryTaskStore()
+    )
+
+    from a2a.utils.errors import ServerError  # Local import for ServerError
+
+    with pytest.raises(ServerError) as exc_info:
+        await request_handler.on_list_tasks(
+            ListTasksParams(updatedSince='yesterday'),
+            create_server_call_context(),
+        )
+
+    assert isinstance(exc_info.value.error, InvalidParamsError)
+
+
+@pytest.mark.asyncio
+async def test_on_list_tasks_unsupported_by_task_store():
+    """Test on_list_tasks when the task store cannot list tasks."""
+    mock_task_store = AsyncMock(spec=TaskStore)
+    mock_task_store.list_tasks.side_effect = NotImplementedError()
+
+    request_handler = DefaultRequestHandler(
+        agent_executor=DummyAgentExecutor(), task_store=mock_task_store
+    )
+
+    from a2a.utils.errors import ServerError  # Local import for ServerError
+
+    with pytest.raises(ServerError) as exc_info:
+        await request_handler.on_list_tasks(
+            ListTasksParams(), create_server_call_context()
+        )
+
+    assert isinstance(exc_info.value.error, UnsupportedOperationError)
+
+
 @pytest.mark.asyncio
 async def test_on_cancel_task_task_not_found():
     """Test on_cancel_task when the task is not found."""
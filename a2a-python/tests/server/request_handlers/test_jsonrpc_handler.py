@@ -31,6 +31,11 @@ from a2a.types import (
     GetTaskSuccessResponse,
     InternalError,
     JSONRPCErrorResponse,
+    ListTasksParams,
+    ListTasksRequest,
+    ListTasksResponse,
+    ListTasksResult,
+    ListTasksSuccessResponse,
     Message,
     MessageSendConfiguration,
     MessageSendParams,
@@ -127,6 +132,22 @@ class TestJSONRPCtHandler(unittest.async_case.IsolatedAsyncioTestCase):
         self.assertIsInstance(response.root, JSONRPCErrorResponse)
         assert response.root.error == TaskNotFoundError()  # type: ignore
 
+    async def test_on_list_tasks_success(self) -> None:
+        mock_agent_executor = AsyncMock(spec=AgentExecutor)
+        mock_task_store = AsyncMock(spec=TaskStore)
+        request_handler = DefaultRequestHandler(
+            mock_agent_executor, mock_task_store
+        )
+        handler = JSONRPCHandler(self.mock_agent_card, request_handler)
+        page = ListTasksResult(tasks=[Task(**MINIMAL_TASK)], nextCursor=None)
+        mock_task_store.list_tasks.return_value = page
+        params = ListTasksParams(contextId=MINIMAL_TASK['contextId'])
+        request = ListTasksRequest(id='1', params=params)
+        response: ListTasksResponse = await handler.on_list_tasks(request)
+        self.assertIsInstance(response.root, ListTasksSuccessResponse)
+        assert response.root.result == page  # type: ignore
+        mock_task_store.list_tasks.assert_awaited_once_with(params)
+
     async def test_on_cancel_task_success(self) -> None:
         mock_agent_executor = AsyncMock(spec=AgentExecutor)
         mock_task_store = AsyncMock(spec=TaskStore)
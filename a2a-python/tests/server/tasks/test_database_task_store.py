@@ -12,6 +12,7 @@ from _pytest.mark.structures import ParameterSet
 pytest.importorskip('sqlalchemy', reason='Database tests require SQLAlchemy')
 
 # Now safe to import SQLAlchemy-dependent modules
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.inspection import inspect
 
@@ -19,6 +20,7 @@ from a2a.server.models import Base, TaskModel  # Important: To get Base.metadata
 from a2a.server.tasks.database_task_store import DatabaseTaskStore
 from a2a.types import (
     Artifact,
+    ListTasksParams,
     Message,
     Part,
     Role,
@@ -397,4 +399,86 @@ async def test_metadata_field_mapping(
     await db_store_parameterized.delete('task-metadata-test-4')
 
 
+@pytest.mark.asyncio
+async def test_list_tasks_filters_and_pages(
+    db_store_parameterized: DatabaseTaskStore,
+) -> None:
+    """Test listing tasks by context and state with cursor pagination."""
+    for i in range(5):
+        await db_store_parameterized.save(
+            MINIMAL_TASK_OBJ.model_copy(
+                update={
+                    'id': f'list-{i}',
+                    'contextId': 'list-ctx',
+                    'status': TaskStatus(state=TaskState.working),
+                }
+            )
+        )
+    await db_store_parameterized.save(
+        MINIMAL_TASK_OBJ.model_copy(
+            update={
+                'id': 'list-done',
+                'contextId': 'list-ctx',
+                'status': TaskStatus(state=TaskState.completed),
+            }
+        )
+    )
+
+    params = ListTasksParams(
+        contextId='list-ctx', state=TaskState.working, pageSize=3
+    )
+    first = await db_store_parameterized.list_tasks(params)
+    assert [t.id for t in first.tasks] == ['list-0', 'list-1', 'list-2']
+    assert first.nextCursor == 'list-2'
+
+    second = await db_store_parameterized.list_tasks(
+        params.model_copy(update={'cursor': first.nextCursor})
+    )
+    assert [t.id for t in second.tasks] == ['list-3', 'list-4']
+    assert second.nextCursor is None
+
+    completed = await db_store_parameterized.list_tasks(
+        ListTasksParams(contextId='list-ctx', state=TaskState.completed)
+    )
+    assert [t.id for t in completed.tasks] == ['list-done']
+
+    future = await db_store_parameterized.list_tasks(
+        ListTasksParams(
+            contextId='list-ctx', updatedSince='2999-01-01T00:00:00Z'
+        )
+    )
+    assert future.tasks == []
+
+    for i in range(5):
+        await db_store_parameterized.delete(f'list-{i}')
+    await db_store_parameterized.delete('list-done')
+
+
+@pytest.mark.asyncio
+async def test_initialize_upgrades_legacy_table() -> None:
+    """Test that a table without the listing columns is upgraded in place."""
+    engine = create_async_engine('sqlite+aiosqlite:///:memory:')
+    async with engine.begin() as conn:
+        await conn.execute(
+            text(
+                'CREATE TABLE tasks (id VARCHAR(36) PRIMARY KEY, '
+                '"contextId" VARCHAR(36) NOT NULL, kind VARCHAR(16) NOT NULL, '
+                'status JSON, artifacts JSON, history JSON, metadata JSON)'
+            )
+        )
+        await conn.execute(
+            text(
+                "INSERT INTO tasks VALUES ('legacy', 'ctx', 'task', "
+                '\'{"state": "working"}\', NULL, NULL, NULL)'
+            )
+        )
+
+    store = DatabaseTaskStore(engine=engine)
+    await store.initialize()
+
+    result = await store.list_tasks(ListTasksParams(state=TaskState.working))
+    assert [t.id for t in result.tasks] == ['legacy']
+    await engine.dispose()
+
+
 # Ensure aiosqlite, asyncpg, and aiomysql are installed in the test environment (added to pyproject.toml).
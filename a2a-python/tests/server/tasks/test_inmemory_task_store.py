@@ -1,9 +1,12 @@
+import asyncio
+
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import pytest
 
 from a2a.server.tasks import InMemoryTaskStore
-from a2a.types import Task
+from a2a.types import ListTasksParams, Task, TaskState
 
 
 MINIMAL_TASK: dict[str, Any] = {
@@ -48,3 +51,150 @@ async def test_in_memory_task_store_delete_nonexistent() -> None:
     """Test deleting a nonexistent task."""
     store = InMemoryTaskStore()
     await store.delete('nonexistent')
+
+
+def _task(task_id: str, state: str = 'submitted') -> Task:
+    return Task(
+        id=task_id,
+        contextId='session-xyz',
+        status={'state': state},
+        kind='task',
+    )
+
+
+@pytest.mark.asyncio
+async def test_in_memory_task_store_max_entries_evicts_terminal_first() -> None:
+    """Test that terminal tasks are evicted before active ones."""
+    store = InMemoryTaskStore(max_entries=2)
+    await store.save(_task('active'))
+    await store.save(_task('done', 'completed'))
+    await store.save(_task('new'))
+
+    assert await store.get('done') is None
+    assert await store.get('active') is not None
+    assert await store.get('new') is not None
+
+
+@pytest.mark.asyncio
+async def test_in_memory_task_store_max_entries_evicts_lru_active() -> None:
+    """Test that the least recently used active task is evicted as fallback."""
+    store = InMemoryTaskStore(max_entries=2)
+    await store.save(_task('a'))
+    await store.save(_task('b'))
+    await store.get('a')
+    await store.save(_task('c'))
+
+    assert await store.get('b') is None
+    assert await store.get('a') is not None
+    assert len(store.tasks) == 2
+
+
+@pytest.mark.asyncio
+async def test_in_memory_task_store_max_bytes() -> None:
+    """Test that the store stays within its byte budget."""
+    size = len(_task('t-0', 'completed').model_dump_json(exclude_none=True))
+    store = InMemoryTaskStore(max_bytes=size * 3)
+    for i in range(5):
+        await store.save(_task(f't-{i}', 'completed'))
+
+    assert len(store.tasks) == 3
+    assert store.memory_usage() <= size * 3
+    assert await store.get('t-0') is None
+    assert await store.get('t-4') is not None
+
+
+@pytest.mark.asyncio
+async def test_in_memory_task_store_ttl_expires_terminal_tasks() -> None:
+    """Test that only terminal tasks expire after the TTL."""
+    store = InMemoryTaskStore(ttl=0)
+    await store.save(_task('active', 'working'))
+    await store.save(_task('done', 'failed'))
+
+    await store.evict_expired()
+
+    assert await store.get('done') is None
+    assert await store.get('active') is not None
+
+
+@pytest.mark.asyncio
+async def test_in_memory_task_store_spill_callback() -> None:
+    """Test that evicted tasks are handed to the spill callback."""
+    secondary = InMemoryTaskStore()
+    store = InMemoryTaskStore(max_entries=1, spill_callback=secondary.save)
+    await store.save(_task('first', 'completed'))
+    await store.save(_task('second'))
+
+    assert await store.get('first') is None
+    assert await secondary.get('first') is not None
+
+
+@pytest.mark.asyncio
+async def test_in_memory_task_store_memory_usage() -> None:
+    """Test the memory usage estimate of an unbounded store."""
+    store = InMemoryTaskStore()
+    assert store.memory_usage() == 0
+    task = Task(**MINIMAL_TASK)
+    await store.save(task)
+    assert store.memory_usage() == len(task.model_dump_json(exclude_none=True))
+
+
+def test_in_memory_task_store_shared_across_threads() -> None:
+    """Test that concurrent saves from several threads are all kept."""
+    store = InMemoryTaskStore(max_entries=1000)
+
+    def worker(n: int) -> None:
+        for i in range(100):
+            asyncio.run(store.save(_task(f'thread-{n}-{i}')))
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(worker, range(4)))
+
+    assert len(store.tasks) == 400
+
+
+@pytest.mark.asyncio
+async def test_in_memory_task_store_list_tasks_filters_and_pages() -> None:
+    """Test listing tasks by context and state with cursor pagination."""
+    store = InMemoryTaskStore()
+    for i in range(5):
+        await store.save(_task(f'work-{i}', 'working'))
+    await store.save(_task('done', 'completed'))
+    await store.save(
+        Task(id='other', contextId='ctx-2', status={'state': 'working'})
+    )
+
+    first = await store.list_tasks(
+        ListTasksParams(
+            contextId='session-xyz', state=TaskState.working, pageSize=3
+        )
+    )
+    assert [t.id for t in first.tasks] == ['work-0', 'work-1', 'work-2']
+    assert first.nextCursor == 'work-2'
+
+    second = await store.list_tasks(
+        ListTasksParams(
+            contextId='session-xyz',
+            state=TaskState.working,
+            pageSize=3,
+            cursor=first.nextCursor,
+        )
+    )
+    assert [t.id for t in second.tasks] == ['work-3', 'work-4']
+    assert second.nextCursor is None
+
+
+@pytest.mark.asyncio
+async def test_in_memory_task_store_list_tasks_updated_since() -> None:
+    """Test filtering listed tasks by last update time."""
+    store = InMemoryTaskStore()
+    await store.save(_task('a'))
+
+    recent = await store.list_tasks(
+        ListTasksParams(updatedSince='2000-01-01T00:00:00Z')
+    )
+    future = await store.list_tasks(
+        ListTasksParams(updatedSince='2999-01-01T00:00:00Z')
+    )
+
+    assert [t.id for t in recent.tasks] == ['a']
+    assert future.tasks == []